@@ -0,0 +1,88 @@
+"""
+Bulk text insertion into the WhatsApp Web message composer
+Replaces the unencoded ?text= URL parameter and per-keystroke send_keys
+"""
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+COMPOSER_SELECTORS = [
+    '//footer//div[@contenteditable="true"][@role="textbox"]',
+    '//div[@contenteditable="true"][@data-tab="10"]',
+    '//div[@contenteditable="true"][@role="textbox"]',
+]
+
+# Text of the composer with emoji images turned back into their characters
+_TEXT_JS = """
+function composerText(el) {
+    const copy = el.cloneNode(true);
+    copy.querySelectorAll('img[alt]').forEach(img => img.replaceWith(img.alt));
+    return copy.textContent;
+}
+"""
+
+# A synthetic paste goes through the editor's own paste handler in one event,
+# so newlines become line breaks and emoji stay intact. The editor applies it
+# on a later tick, so wait a frame before falling back to execCommand for
+# composers that ignore untrusted paste events.
+_INSERT_JS = _TEXT_JS + """
+const el = arguments[0], text = arguments[1], done = arguments[arguments.length - 1];
+const settle = next => requestAnimationFrame(() => setTimeout(next, 0));
+el.focus();
+const data = new DataTransfer();
+data.setData('text/plain', text);
+el.dispatchEvent(new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true}));
+settle(() => {
+    if (composerText(el).trim()) {
+        done(composerText(el));
+        return;
+    }
+    document.execCommand('insertText', false, text);
+    settle(() => done(composerText(el)));
+});
+"""
+
+_CLEAR_JS = _TEXT_JS + """
+const el = arguments[0], done = arguments[arguments.length - 1];
+el.focus();
+document.execCommand('selectAll', false, null);
+document.execCommand('delete', false, null);
+requestAnimationFrame(() => setTimeout(() => done(composerText(el)), 0));
+"""
+
+
+def _squash(text: str) -> str:
+    """Text without any whitespace, the editor splits lines into paragraphs"""
+    return "".join(text.split())
+
+
+def chat_url(phone: str) -> str:
+    """Chat URL without any message text"""
+    return f"https://web.whatsapp.com/send?phone={phone}"
+
+
+def find_composer(wait):
+    """Wait for the chat's message input and return it"""
+    for selector in COMPOSER_SELECTORS:
+        try:
+            return wait.until(EC.presence_of_element_located((By.XPATH, selector)))
+        except:
+            continue
+    raise Exception("Message input not found")
+
+
+def insert_text(driver, composer, text: str) -> bool:
+    """Put text into an emptied composer in one round-trip, keeping line breaks"""
+    # WhatsApp keeps per-chat drafts, never append to one
+    if not clear_text(driver, composer):
+        return False
+    inserted = driver.execute_async_script(_INSERT_JS, composer, text)
+    if _squash(inserted) != _squash(text):
+        clear_text(driver, composer)
+        return False
+    return True
+
+
+def clear_text(driver, composer) -> bool:
+    """Empty the composer without sending"""
+    return not driver.execute_async_script(_CLEAR_JS, composer).strip()
@@ -0,0 +1,236 @@
+"""
+Follow mode: read new contacts from an append-only feed as they arrive
+A feed is a CSV or JSONL file, or a spool directory of them. Byte offsets of
+sent rows are persisted, so a restart resumes after the last committed row.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import time
+from typing import Callable, Dict, List
+
+FOLLOW_STATE_FILE = "follow_state.json"
+FOLLOW_JOURNAL_FILE = "follow_journal.jsonl"
+FOLLOW_FAILED_FILE = "follow_failed.jsonl"  # itself a feed, for --follow to retry
+FEED_SUFFIXES = (".csv", ".jsonl")
+
+# A CSV record with an open quote is given up on after this many lines or
+# once it has waited this long for its closing quote. Only the line with the
+# stray quote is then journaled as invalid.
+MAX_RECORD_LINES = 50
+OPEN_RECORD_TIMEOUT = 60
+FINGERPRINT_BYTES = 64
+
+
+class FeedFollower:
+    """Tails a feed by byte offset and records what was done with each row"""
+
+    def __init__(self, feed_path: str, state_file: str = FOLLOW_STATE_FILE,
+                 journal_file: str = FOLLOW_JOURNAL_FILE, failed_file: str = FOLLOW_FAILED_FILE,
+                 log: Callable[[str], None] = print):
+        self.feed_path = feed_path
+        self.state_file = state_file
+        self.journal_file = journal_file
+        self.failed_file = failed_file
+        self.log = log
+        self.state = {}
+        if os.path.exists(state_file):
+            with open(state_file, 'r', encoding='utf-8') as file:
+                self.state = json.load(file)
+        # Read position per file, ahead of the committed offset while rows
+        # handed out by poll() are still being sent
+        self.positions = {}
+        # Position and first-seen time of a CSV record still waiting for its closing quote
+        self.open_records = {}
+        self.missing = False
+
+    def feed_files(self) -> List[str]:
+        """Files to follow, in name order for a spool directory"""
+        if os.path.isdir(self.feed_path):
+            names = sorted(
+                name for name in os.listdir(self.feed_path)
+                if name.lower().endswith(FEED_SUFFIXES)
+            )
+            return [os.path.join(self.feed_path, name) for name in names]
+        return [self.feed_path] if os.path.exists(self.feed_path) else []
+
+    def poll(self) -> List[Dict]:
+        """Rows appended since the last poll, each tagged with its end offset"""
+        if not os.path.exists(self.feed_path):
+            if not self.missing:
+                self.log(f"Feed {self.feed_path} does not exist, waiting for it to appear")
+            self.missing = True
+            return []
+        self.missing = False
+
+        rows = []
+        for path in self.feed_files():
+            rows.extend(self._read_new(os.path.abspath(path)))
+        return rows
+
+    def rewind(self):
+        """Forget rows handed out but not committed, the next poll reads them again"""
+        self.positions.clear()
+
+    def _identity(self, path: str, offset: int) -> Dict:
+        """File id plus a hash of the bytes just before offset"""
+        stat = os.stat(path)
+        with open(path, 'rb') as file:
+            file.seek(max(0, offset - FINGERPRINT_BYTES))
+            tail = file.read(min(offset, FINGERPRINT_BYTES))
+        return {
+            'file': f"{stat.st_dev}:{stat.st_ino}",
+            'tail': hashlib.sha1(tail).hexdigest()
+        }
+
+    def _replaced(self, path: str, entry: Dict, size: int) -> bool:
+        """Whether the file is no longer the one the stored offset belongs to"""
+        if size < entry['offset']:
+            return True
+        if 'file' not in entry:
+            return False
+        identity = self._identity(path, entry['offset'])
+        return identity['file'] != entry['file'] or identity['tail'] != entry['tail']
+
+    def _read_new(self, path: str) -> List[Dict]:
+        entry = self.state.setdefault(path, {'offset': 0})
+        size = os.path.getsize(path)
+
+        position = self.positions.get(path, entry['offset'])
+        if size < position or self._replaced(path, entry, size):
+            # Truncated or replaced, the old offsets mean nothing any more
+            self.log(f"{path} was truncated or replaced, reading it from the start")
+            entry.clear()
+            entry['offset'] = position = 0
+            self.positions.pop(path, None)
+            self.open_records.pop(path, None)
+            self._save_state()
+        if size <= position:
+            return []
+
+        with open(path, 'rb') as file:
+            file.seek(position)
+            data = file.read(size - position)
+
+        lines = data.splitlines(keepends=True)
+        if lines and not lines[-1].endswith(b"\n"):
+            lines.pop()  # writer is still mid-line
+
+        is_csv = path.lower().endswith(".csv")
+        rows = []
+        i = 0
+        while i < len(lines):
+            # A quoted CSV field may span lines, look for its closing quote
+            j = i + 1
+            quotes = lines[i].count(b'"')
+            while is_csv and quotes % 2 and j < len(lines) and j - i < MAX_RECORD_LINES:
+                quotes += lines[j].count(b'"')
+                j += 1
+
+            broken = False
+            if is_csv and quotes % 2:
+                if j - i < MAX_RECORD_LINES and self._open_age(path, position) < OPEN_RECORD_TIMEOUT:
+                    break  # closing quote may still be on its way
+                # Stray quote, drop only its own line and carry on after it
+                j = i + 1
+                broken = True
+            self.open_records.pop(path, None)
+
+            record = b"".join(lines[i:j])
+            start, position = position, position + len(record)
+            i = j
+
+            try:
+                text = record.decode('utf-8-sig' if start == 0 else 'utf-8')
+            except UnicodeDecodeError:
+                broken = True
+            if broken:
+                rows.append(self._parse(path, entry, None, position))
+                continue
+            if not text.strip():
+                continue
+
+            if is_csv and 'fields' not in entry:
+                entry['fields'] = next(csv.reader(io.StringIO(text)))
+                entry['offset'] = position
+                entry.update(self._identity(path, position))
+                self._save_state()
+                continue
+
+            rows.append(self._parse(path, entry, text, position))
+
+        self.positions[path] = position
+        return rows
+
+    def _open_age(self, path: str, position: int) -> float:
+        """Seconds the record at position has been waiting for its closing quote"""
+        now = time.monotonic()
+        seen = self.open_records.get(path)
+        if not seen or seen[0] != position:
+            self.open_records[path] = (position, now)
+            return 0.0
+        return now - seen[1]
+
+    def _parse(self, path: str, entry: Dict, text: str, end: int) -> Dict:
+        """Contact from one CSV record or JSONL line, invalid rows are kept for journaling"""
+        try:
+            if text is None:
+                row = {}
+            elif 'fields' in entry:
+                row = dict(zip(entry['fields'], next(csv.reader(io.StringIO(text)))))
+            else:
+                row = json.loads(text)
+        except (ValueError, StopIteration):
+            row = {}
+
+        contact = {'source': path, 'offset': end, 'valid': False}
+        if isinstance(row, dict) and row.get('name') and row.get('phone') and row.get('message'):
+            contact.update({
+                'name': str(row['name']).strip(),
+                'phone': str(row['phone']).strip().replace(' ', ''),
+                'message': str(row['message']).strip(),
+                'valid': True
+            })
+        return contact
+
+    def commit(self, contact: Dict, status: str):
+        """Journal the outcome of a row, then move the file's offset past it"""
+        if status == "failed":
+            # Keep the row so it can be sent again with --follow on this file
+            with open(self.failed_file, 'a', encoding='utf-8') as file:
+                file.write(json.dumps({
+                    'name': contact['name'],
+                    'phone': contact['phone'],
+                    'message': contact['message']
+                }, ensure_ascii=False) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+
+        with open(self.journal_file, 'a', encoding='utf-8') as file:
+            file.write(json.dumps({
+                'time': time.strftime("%Y-%m-%d %H:%M:%S"),
+                'source': contact['source'],
+                'offset': contact['offset'],
+                'name': contact.get('name'),
+                'phone': contact.get('phone'),
+                'status': status
+            }, ensure_ascii=False) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+        entry = self.state[contact['source']]
+        entry['offset'] = contact['offset']
+        entry.update(self._identity(contact['source'], contact['offset']))
+        self._save_state()
+
+    def _save_state(self):
+        """Write offsets atomically so a crash never leaves a torn file"""
+        temp_file = self.state_file + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(self.state, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, self.state_file)
@@ -0,0 +1,182 @@
+"""
+Campaign duration planner
+Estimates how long a campaign will take from latencies recorded on earlier runs
+"""
+
+import json
+import math
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+STATS_FILE = "latency_stats.json"
+MAX_SAMPLES = 1000  # per stage, oldest samples are dropped
+MIN_SAMPLES = 5     # below this the built-in prior is used
+
+# Prior for a fresh install: 10s of settle sleeps in send_message plus page
+# load and Selenium round-trips, a failed send's 5s settle plus up to three
+# 20s composer waits, and a QR scan for login
+DEFAULT_STAGES = {
+    "send": (13.0, 4.0),
+    "failed_send": (45.0, 20.0),
+    "login": (30.0, 20.0),
+}
+
+Z_90 = 1.645  # two-sided 90% bounds
+
+
+class LatencyStats:
+    """Per-stage latency samples persisted between runs"""
+
+    def __init__(self, file_path: str = STATS_FILE):
+        self.file_path = file_path
+        self.stages = {}
+        if os.path.exists(file_path):
+            try:
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    self.stages = json.load(file)
+            except (OSError, ValueError):
+                self.stages = {}
+
+    def record(self, stage: str, seconds: float):
+        """Add one sample for stage"""
+        samples = self.stages.setdefault(stage, [])
+        samples.append(round(seconds, 3))
+        del samples[:-MAX_SAMPLES]
+
+    def distribution(self, stage: str) -> Tuple[float, float, int]:
+        """Mean, standard deviation and sample count for stage"""
+        samples = self.stages.get(stage, [])
+        if len(samples) < MIN_SAMPLES:
+            mean, std = DEFAULT_STAGES[stage]
+            return mean, std, len(samples)
+
+        mean = sum(samples) / len(samples)
+        variance = sum((s - mean) ** 2 for s in samples) / (len(samples) - 1)
+        return mean, math.sqrt(variance), len(samples)
+
+    def attempt_distribution(self) -> Tuple[float, float, int]:
+        """Mean, standard deviation and count of one send attempt, failures included"""
+        send_mean, send_std, sent = self.distribution("send")
+        fail_mean, fail_std, failed = self.distribution("failed_send")
+        attempts = sent + failed
+        if not failed or attempts < MIN_SAMPLES:
+            return send_mean, send_std, attempts
+
+        # Mixture of successful and failed attempts at the recorded failure rate
+        p = failed / attempts
+        mean = p * fail_mean + (1 - p) * send_mean
+        second_moment = p * (fail_std ** 2 + fail_mean ** 2) + (1 - p) * (send_std ** 2 + send_mean ** 2)
+        return mean, math.sqrt(max(0.0, second_moment - mean ** 2)), attempts
+
+    def save(self):
+        """Write samples back to disk"""
+        with open(self.file_path, 'w', encoding='utf-8') as file:
+            json.dump(self.stages, file)
+
+
+def _window_bounds(t: datetime, send_window: Tuple[int, int]) -> Tuple[datetime, datetime]:
+    """Open and close time of the window containing t, or the next one"""
+    start_hour, end_hour = send_window
+    length = timedelta(hours=(end_hour - start_hour) % 24 or 24)
+    midnight = t.replace(hour=0, minute=0, second=0, microsecond=0)
+    for day in (-1, 0, 1):
+        opens = midnight + timedelta(days=day, hours=start_hour)
+        if opens + length > t:
+            return opens, opens + length
+
+
+def seconds_until_window(send_window: Optional[Tuple[int, int]], now: datetime = None) -> float:
+    """Seconds to wait before sending is allowed, 0 inside the window"""
+    if not send_window:
+        return 0.0
+    now = now or datetime.now()
+    opens, _ = _window_bounds(now, send_window)
+    return max(0.0, (opens - now).total_seconds())
+
+
+def wall_time(active_seconds: float, send_window: Optional[Tuple[int, int]], start: datetime = None) -> float:
+    """Wall-clock seconds needed for active_seconds of sending inside the window"""
+    if not send_window:
+        return active_seconds
+
+    start = start or datetime.now()
+    t = start
+    remaining = active_seconds
+    while remaining > 0:
+        opens, closes = _window_bounds(t, send_window)
+        t = max(t, opens)
+        chunk = min(remaining, (closes - t).total_seconds())
+        t += timedelta(seconds=chunk)
+        remaining -= chunk
+    return (t - start).total_seconds()
+
+
+def estimate_duration(
+    stats: LatencyStats,
+    rows: int,
+    min_delay: int,
+    max_delay: int,
+    skip_ratio: float = 0.0,
+    send_window: Optional[Tuple[int, int]] = None,
+    include_login: bool = True,
+    start: datetime = None
+) -> Dict:
+    """Expected duration of a campaign with 90% bounds, all in seconds"""
+    messages = max(0, round(rows * (1.0 - skip_ratio)))
+    send_mean, send_std, samples = stats.attempt_distribution()
+
+    # randint(min, max) pacing between messages
+    span = max_delay - min_delay + 1
+    pace_mean = (min_delay + max_delay) / 2
+    pace_var = (span * span - 1) / 12
+    waits = max(0, messages - 1)
+
+    # Sum of independent per-message times, so means and variances add,
+    # plus the uncertainty of the mean itself which shrinks with history
+    mean = messages * send_mean + waits * pace_mean
+    variance = messages * send_std ** 2 + waits * pace_var
+    variance += (messages * send_std) ** 2 / max(samples, MIN_SAMPLES)
+    if include_login and messages:
+        login_mean, login_std, _ = stats.distribution("login")
+        mean += login_mean
+        variance += login_std ** 2
+
+    margin = Z_90 * math.sqrt(variance)
+    low = max(0.0, mean - margin)
+    high = mean + margin
+
+    start = start or datetime.now()
+    return {
+        'messages': messages,
+        'samples': samples,
+        'low': wall_time(low, send_window, start),
+        'expected': wall_time(mean, send_window, start),
+        'high': wall_time(high, send_window, start),
+    }
+
+
+def format_duration(seconds: float) -> str:
+    """Human readable duration such as 2d 3h 05m"""
+    minutes = int(round(seconds / 60))
+    days, minutes = divmod(minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    if days:
+        return f"{days}d {hours}h {minutes:02d}m"
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m"
+    return f"{int(round(seconds))}s"
+
+
+def describe_estimate(estimate: Dict) -> str:
+    """One-line summary of an estimate for logs and dialogs"""
+    if estimate['samples'] < MIN_SAMPLES:
+        basis = "no run history yet, using defaults"
+    else:
+        basis = f"based on {estimate['samples']} recorded send attempts"
+    return (
+        f"~{format_duration(estimate['expected'])} for {estimate['messages']} messages "
+        f"(90%: {format_duration(estimate['low'])} – {format_duration(estimate['high'])}, {basis})"
+    )
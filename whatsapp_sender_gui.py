@@ -15,13 +15,18 @@ from typing import List, Dict
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException
 
+from whatsapp_composer import chat_url, find_composer, insert_text
+from whatsapp_planner import LatencyStats, estimate_duration, describe_estimate, format_duration, seconds_until_window
+from whatsapp_trace import tracer, run_profiled, CAT_SETUP, CAT_PAGE, CAT_SELENIUM, CAT_PACING
+
 # Configuration
 MIN_DELAY = 5
 MAX_DELAY = 10
+EXPECTED_SKIP_RATIO = 0.0  # share of rows expected to be skipped, used for planning
+SEND_WINDOW = None  # e.g. (9, 21) to only send between 09:00 and 21:00
 
 class WhatsAppSenderGUI:
     def __init__(self, root):
@@ -31,12 +36,15 @@ class WhatsAppSenderGUI:
         self.root.resizable(True, True)
         
         # Variables
-        self.csv_file = None
-        self.contacts = []
+        self.campaigns = []
         self.driver = None
         self.wait = None
+        self.logged_in = False
+        self.stats = LatencyStats()
         self.is_sending = False
         self.should_stop = False
+        self.trace_var = BooleanVar(value=False)
+        self.profile_var = BooleanVar(value=False)
         
         # Colors
         self.bg_color = "#f0f0f0"
@@ -49,6 +57,9 @@ class WhatsAppSenderGUI:
         # Create UI
         self.create_widgets()
         
+        # Browser session outlives a single run, so close it with the window
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
     def create_widgets(self):
         """Create all UI widgets"""
         
@@ -73,7 +84,7 @@ class WhatsAppSenderGUI:
         # CSV File Section
         csv_frame = LabelFrame(
             main_frame,
-            text="📄 CSV File",
+            text="📄 Campaign Queue",
             font=("Arial", 12, "bold"),
             bg=self.bg_color,
             fg=self.secondary_color,
@@ -91,9 +102,23 @@ class WhatsAppSenderGUI:
         )
         self.file_label.pack(side=LEFT, padx=(0, 10))
         
+        clear_btn = Button(
+            csv_frame,
+            text="Clear Queue",
+            command=self.clear_queue,
+            bg=self.error_color,
+            fg="white",
+            font=("Arial", 10, "bold"),
+            cursor="hand2",
+            relief=FLAT,
+            padx=15,
+            pady=5
+        )
+        clear_btn.pack(side=RIGHT, padx=(10, 0))
+        
         browse_btn = Button(
             csv_frame,
-            text="Browse CSV",
+            text="Add CSV",
             command=self.browse_file,
             bg=self.primary_color,
             fg="white",
@@ -151,13 +176,29 @@ class WhatsAppSenderGUI:
         
         self.progress_label = Label(
             progress_frame,
-            text="0 / 0 messages sent",
+            text="Campaign: 0 / 0 messages sent",
             font=("Arial", 10),
             bg=self.bg_color,
             fg="#666"
         )
         self.progress_label.pack()
         
+        self.queue_progress = ttk.Progressbar(
+            progress_frame,
+            length=400,
+            mode='determinate'
+        )
+        self.queue_progress.pack(fill=X, pady=(5, 5))
+        
+        self.queue_label = Label(
+            progress_frame,
+            text="Queue: 0 / 0 messages sent",
+            font=("Arial", 10),
+            bg=self.bg_color,
+            fg="#666"
+        )
+        self.queue_label.pack()
+        
         # Status Log
         status_frame = LabelFrame(
             main_frame,
@@ -217,6 +258,24 @@ class WhatsAppSenderGUI:
         )
         self.stop_btn.pack(side=LEFT)
         
+        profile_check = Checkbutton(
+            button_frame,
+            text="cProfile",
+            variable=self.profile_var,
+            font=("Arial", 10),
+            bg=self.bg_color
+        )
+        profile_check.pack(side=RIGHT)
+        
+        trace_check = Checkbutton(
+            button_frame,
+            text="Record trace",
+            variable=self.trace_var,
+            font=("Arial", 10),
+            bg=self.bg_color
+        )
+        trace_check.pack(side=RIGHT)
+        
     def log_status(self, message, level="info"):
         """Add message to status log"""
         self.status_text.config(state=NORMAL)
@@ -229,23 +288,25 @@ class WhatsAppSenderGUI:
         self.status_text.config(state=DISABLED)
         
     def browse_file(self):
-        """Open file dialog to select CSV"""
-        filename = filedialog.askopenfilename(
-            title="Select CSV File",
+        """Open file dialog to add CSVs to the queue"""
+        filenames = filedialog.askopenfilenames(
+            title="Select CSV Files",
             filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")]
         )
         
-        if filename:
-            self.csv_file = filename
-            self.load_contacts()
+        for filename in filenames:
+            self.load_contacts(filename)
+        
+        if filenames:
+            self.refresh_queue()
             
-    def load_contacts(self):
-        """Load contacts from CSV file"""
+    def load_contacts(self, csv_file):
+        """Load contacts from a CSV file and queue them as a campaign"""
         try:
-            self.log_status(f"Loading CSV file: {os.path.basename(self.csv_file)}", "info")
+            self.log_status(f"Loading CSV file: {os.path.basename(csv_file)}", "info")
             
             contacts = []
-            with open(self.csv_file, 'r', encoding='utf-8') as file:
+            with open(csv_file, 'r', encoding='utf-8') as file:
                 reader = csv.DictReader(file)
                 for row in reader:
                     if row.get('name') and row.get('phone') and row.get('message'):
@@ -258,32 +319,59 @@ class WhatsAppSenderGUI:
             if not contacts:
                 raise ValueError("No valid contacts found in CSV")
             
-            self.contacts = contacts
-            
-            # Update UI
-            self.file_label.config(
-                text=f"✓ {os.path.basename(self.csv_file)} ({len(contacts)} contacts)",
-                fg=self.secondary_color
-            )
-            
-            # Display contacts
-            self.contacts_text.config(state=NORMAL)
-            self.contacts_text.delete(1.0, END)
-            for i, contact in enumerate(contacts, 1):
-                self.contacts_text.insert(END, f"{i}. {contact['name']} - {contact['phone']}\n")
-            self.contacts_text.config(state=DISABLED)
-            
-            # Enable start button
-            self.start_btn.config(state=NORMAL)
+            self.campaigns.append({
+                'name': os.path.basename(csv_file),
+                'file': csv_file,
+                'contacts': contacts
+            })
             
-            self.log_status(f"Loaded {len(contacts)} contacts successfully", "success")
+            self.log_status(f"Queued {os.path.basename(csv_file)} with {len(contacts)} contacts", "success")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load CSV:\n{str(e)}")
             self.log_status(f"Error loading CSV: {str(e)}", "error")
             
+    def refresh_queue(self):
+        """Show the queued campaigns and their contacts"""
+        total = sum(len(c['contacts']) for c in self.campaigns)
+        
+        if self.campaigns:
+            self.file_label.config(
+                text=f"✓ {len(self.campaigns)} campaigns ({total} contacts)",
+                fg=self.secondary_color
+            )
+        else:
+            self.file_label.config(text="No file selected", fg="#666")
+        
+        self.contacts_text.config(state=NORMAL)
+        self.contacts_text.delete(1.0, END)
+        if not self.campaigns:
+            self.contacts_text.insert(END, "No contacts loaded yet.\n\nUpload a CSV file to begin.")
+        for n, campaign in enumerate(self.campaigns, 1):
+            self.contacts_text.insert(END, f"Campaign {n}: {campaign['name']} ({len(campaign['contacts'])} contacts)\n")
+            for i, contact in enumerate(campaign['contacts'], 1):
+                self.contacts_text.insert(END, f"   {i}. {contact['name']} - {contact['phone']}\n")
+        self.contacts_text.config(state=DISABLED)
+        
+        if not self.is_sending:
+            self.start_btn.config(state=NORMAL if self.campaigns else DISABLED)
+            
+    def clear_queue(self):
+        """Remove all queued campaigns"""
+        if self.is_sending:
+            messagebox.showwarning("Sending", "Stop sending before clearing the queue")
+            return
+        
+        self.campaigns = []
+        self.refresh_queue()
+        self.log_status("Campaign queue cleared", "info")
+            
     def setup_driver(self):
         """Set up Chrome driver"""
+        with tracer.span("setup_driver", CAT_SETUP):
+            return self._setup_driver()
+            
+    def _setup_driver(self):
         try:
             self.log_status("Setting up Chrome browser...", "info")
             
@@ -295,7 +383,8 @@ class WhatsAppSenderGUI:
                 "profile.default_content_setting_values.notifications": 2
             })
             
-            self.driver = webdriver.Chrome(options=chrome_options)
+            with tracer.span("launch chrome", CAT_SETUP):
+                self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.maximize_window()
             self.wait = WebDriverWait(self.driver, 20)
             
@@ -311,7 +400,8 @@ class WhatsAppSenderGUI:
         """Open WhatsApp Web and wait for login"""
         try:
             self.log_status("Opening WhatsApp Web...", "info")
-            self.driver.get("https://web.whatsapp.com")
+            with tracer.span("open whatsapp web", CAT_PAGE):
+                self.driver.get("https://web.whatsapp.com")
             
             self.log_status("Please scan QR code (3 minutes timeout)...", "warning")
             messagebox.showinfo(
@@ -321,16 +411,22 @@ class WhatsAppSenderGUI:
             
             # Wait for login
             login_wait = WebDriverWait(self.driver, 180)
-            for attempt in range(36):
-                try:
-                    self.driver.find_element(By.XPATH, '//div[@contenteditable="true"][@data-tab="3"]')
-                    self.log_status("Logged in successfully!", "success")
-                    time.sleep(3)
-                    return True
-                except:
-                    if self.should_stop:
-                        return False
-                    time.sleep(5)
+            logged_in = False
+            with tracer.span("wait for qr scan", CAT_SELENIUM):
+                for attempt in range(36):
+                    try:
+                        self.driver.find_element(By.XPATH, '//div[@contenteditable="true"][@data-tab="3"]')
+                        logged_in = True
+                        break
+                    except:
+                        if self.should_stop:
+                            return False
+                        time.sleep(5)
+            
+            if logged_in:
+                self.log_status("Logged in successfully!", "success")
+                tracer.sleep(3, "settle after login")
+                return True
             
             self.log_status("QR code scan timeout", "error")
             return False
@@ -339,124 +435,255 @@ class WhatsAppSenderGUI:
             self.log_status(f"Error opening WhatsApp: {str(e)}", "error")
             return False
             
+    def session_alive(self) -> bool:
+        """Check whether the browser from a previous run is still usable"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+            
+    def ensure_session(self) -> bool:
+        """Reuse the logged-in browser or start and log in a new one"""
+        if self.logged_in and self.session_alive():
+            self.log_status("Reusing logged-in WhatsApp Web session", "success")
+            return True
+        
+        self.close_driver()
+        started = time.perf_counter()
+        
+        if not self.setup_driver():
+            return False
+        
+        with tracer.span("login"):
+            logged_in = self.open_whatsapp()
+        if not logged_in:
+            self.log_status("Failed to login to WhatsApp Web", "error")
+            self.close_driver()
+            return False
+        
+        self.logged_in = True
+        self.stats.record("login", time.perf_counter() - started)
+        return True
+        
+    def close_driver(self):
+        """Quit the browser session"""
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+        self.driver = None
+        self.wait = None
+        self.logged_in = False
+            
     def send_message(self, phone: str, message: str) -> bool:
         """Send a single message"""
         try:
-            url = f"https://web.whatsapp.com/send?phone={phone}&text={message}"
-            self.driver.get(url)
-            time.sleep(5)
+            with tracer.span("open chat", CAT_PAGE):
+                self.driver.get(chat_url(phone))
+            tracer.sleep(5, "settle after load")
             
             # Wait for message input
-            selectors = [
-                '//div[@contenteditable="true"][@data-tab="10"]',
-                '//div[@contenteditable="true"][@role="textbox"]',
-            ]
+            with tracer.span("wait composer", CAT_SELENIUM):
+                composer = find_composer(self.wait)
             
-            for selector in selectors:
-                try:
-                    self.wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-                    break
-                except:
-                    continue
+            # Paste the whole message at once instead of passing it in the URL
+            with tracer.span("insert text", CAT_SELENIUM, chars=len(message)):
+                if not insert_text(self.driver, composer, message):
+                    raise Exception("Input box does not hold exactly the message text")
             
-            time.sleep(3)
+            tracer.sleep(3, "settle before send")
             
             # Find and click send button
-            try:
-                send_btn = self.driver.find_element(By.XPATH, '//button[@data-testid="send"]')
-            except:
+            with tracer.span("find send button", CAT_SELENIUM):
                 try:
-                    send_btn = self.driver.find_element(By.XPATH, '//button[.//span[@data-icon="send"]]')
+                    send_btn = self.driver.find_element(By.XPATH, '//button[@data-testid="send"]')
                 except:
-                    send_btn = self.driver.find_element(By.XPATH, '//button[contains(@aria-label, "Send")]')
-            
-            send_btn.click()
-            time.sleep(2)
+                    try:
+                        send_btn = self.driver.find_element(By.XPATH, '//button[.//span[@data-icon="send"]]')
+                    except:
+                        send_btn = self.driver.find_element(By.XPATH, '//button[contains(@aria-label, "Send")]')
+            
+            with tracer.span("click send", CAT_SELENIUM):
+                send_btn.click()
+            tracer.sleep(2, "settle after send")
             return True
             
         except Exception as e:
             self.log_status(f"Send error: {str(e)[:100]}", "error")
             return False
             
+    def send_campaign(self, campaign, number, queue):
+        """Send one queued campaign on the logged-in session, returns (sent, attempted)"""
+        contacts = campaign['contacts']
+        total = len(contacts)
+        sent = 0
+        attempted = 0
+        
+        self.log_status(f"Campaign {number}/{queue['campaigns']}: {campaign['name']} ({total} messages)", "info")
+        self.progress['value'] = 0
+        self.progress_label.config(text=f"Campaign {number}/{queue['campaigns']}: 0 / {total} messages sent")
+        
+        for i, contact in enumerate(contacts, 1):
+            if self.should_stop:
+                break
+            
+            name = contact['name']
+            phone = contact['phone']
+            message = contact['message'].replace('{name}', name)
+            
+            # Hold until the send window opens
+            if not self.wait_for_send_window():
+                break
+            
+            self.log_status(f"[{i}/{total}] Sending to {name} ({phone})", "info")
+            
+            started = time.perf_counter()
+            with tracer.span("send_message", phone=phone, campaign=campaign['name']):
+                ok = self.send_message(phone, message)
+            self.stats.record("send" if ok else "failed_send", time.perf_counter() - started)
+            attempted += 1
+            
+            if ok:
+                sent += 1
+                self.log_status(f"✓ Message sent to {name}", "success")
+            else:
+                self.log_status(f"✗ Failed to send to {name}", "error")
+            
+            # Update progress
+            queue['done'] += 1
+            self.progress['value'] = (i / total) * 100
+            self.progress_label.config(text=f"Campaign {number}/{queue['campaigns']}: {i} / {total} messages sent")
+            self.queue_progress['value'] = (queue['done'] / queue['total']) * 100
+            self.queue_label.config(text=f"Queue: {queue['done']} / {queue['total']} messages sent{self.eta_text(queue)}")
+            
+            # Wait before next message, also across campaign boundaries
+            if queue['done'] < queue['total'] and not self.should_stop:
+                delay = random.randint(MIN_DELAY, MAX_DELAY)
+                self.log_status(f"Waiting {delay} seconds...", "info")
+                tracer.sleep(delay, "pacing wait", CAT_PACING)
+        
+        if attempted < total:
+            self.log_status(f"Campaign {campaign['name']} stopped after {attempted}/{total}. Sent: {sent}", "warning")
+        else:
+            self.log_status(f"Campaign {campaign['name']} complete! Sent: {sent}/{total}", "success")
+        return sent, attempted
+            
+    def wait_for_send_window(self) -> bool:
+        """Sleep until SEND_WINDOW opens, False if stopped meanwhile"""
+        hold = seconds_until_window(SEND_WINDOW)
+        if not hold:
+            return True
+        
+        self.log_status(f"Outside send window, waiting {format_duration(hold)}...", "warning")
+        with tracer.span("send window wait", CAT_PACING):
+            while seconds_until_window(SEND_WINDOW):
+                if self.should_stop:
+                    return False
+                time.sleep(1)
+        return True
+        
+    def eta_text(self, queue) -> str:
+        """Remaining time for the queue, refined with this run's latencies"""
+        remaining = queue['total'] - queue['done']
+        if not remaining:
+            return ""
+        eta = estimate_duration(
+            self.stats, remaining, MIN_DELAY, MAX_DELAY,
+            send_window=SEND_WINDOW, include_login=False
+        )
+        return f" | ETA {format_duration(eta['expected'])} ({format_duration(eta['low'])} – {format_duration(eta['high'])})"
+            
     def send_messages_thread(self):
-        """Send messages in a separate thread"""
+        """Send every queued campaign in a separate thread"""
         try:
-            # Setup browser
-            if not self.setup_driver():
-                self.reset_ui()
-                return
-            
-            # Open WhatsApp
-            if not self.open_whatsapp():
-                self.log_status("Failed to login to WhatsApp Web", "error")
-                if self.driver:
-                    self.driver.quit()
-                self.reset_ui()
+            # Browser launch and login are paid once per session
+            if not self.ensure_session():
                 return
             
-            # Send messages
-            total = len(self.contacts)
-            sent = 0
+            campaigns = list(self.campaigns)
+            queue_total = sum(len(c['contacts']) for c in campaigns)
+            queue = {'campaigns': len(campaigns), 'done': 0, 'total': queue_total}
+            results = []
             
-            self.log_status(f"Starting to send {total} messages...", "info")
+            self.log_status(f"Starting {len(campaigns)} campaigns ({queue_total} messages)...", "info")
             
-            for i, contact in enumerate(self.contacts, 1):
+            for n, campaign in enumerate(campaigns, 1):
                 if self.should_stop:
-                    self.log_status("Sending stopped by user", "warning")
                     break
-                
-                name = contact['name']
-                phone = contact['phone']
-                message = contact['message'].replace('{name}', name)
-                
-                self.log_status(f"[{i}/{total}] Sending to {name} ({phone})", "info")
-                
-                if self.send_message(phone, message):
-                    sent += 1
-                    self.log_status(f"✓ Message sent to {name}", "success")
-                else:
-                    self.log_status(f"✗ Failed to send to {name}", "error")
-                
-                # Update progress
-                progress = (i / total) * 100
-                self.progress['value'] = progress
-                self.progress_label.config(text=f"{i} / {total} messages sent")
-                
-                # Wait before next message
-                if i < total and not self.should_stop:
-                    delay = random.randint(MIN_DELAY, MAX_DELAY)
-                    self.log_status(f"Waiting {delay} seconds...", "info")
-                    time.sleep(delay)
-            
-            # Summary
-            self.log_status(f"Complete! Sent: {sent}/{total}", "success")
+                with tracer.span(f"campaign {campaign['name']}"):
+                    sent, attempted = self.send_campaign(campaign, n, queue)
+                results.append((campaign, sent, attempted))
             
-            # Close browser
-            if self.driver:
-                self.driver.quit()
+            stopped = queue['done'] < queue_total
             
-            messagebox.showinfo(
-                "Complete",
-                f"Sending complete!\n\nTotal: {total}\nSent: {sent}\nFailed: {total - sent}"
+            # Summary
+            sent_total = sum(sent for _, sent, _ in results)
+            lines = "\n".join(
+                f"{campaign['name']}: {sent}/{len(campaign['contacts'])}" for campaign, sent, _ in results
             )
             
+            # Drop what was attempted so Start does not resend it, a stopped
+            # campaign keeps only its unsent contacts
+            for campaign, _, attempted in results:
+                campaign['contacts'] = campaign['contacts'][attempted:]
+            self.campaigns = [c for c in self.campaigns if c['contacts']]
+            self.refresh_queue()
+            
+            if stopped:
+                self.log_status(f"Sending stopped by user. Sent: {sent_total}, not attempted: {queue_total - queue['done']}", "warning")
+            else:
+                self.log_status(f"Queue complete! Sent: {sent_total}/{queue_total}", "success")
+            self.log_status("Browser kept open for the next run", "info")
+            
+            if stopped:
+                messagebox.showinfo(
+                    "Stopped",
+                    f"Sending stopped!\n\n{lines}\n\nAttempted: {queue['done']}/{queue_total}\nSent: {sent_total}\n"
+                    f"{queue_total - queue['done']} unsent contacts stay in the queue."
+                )
+            else:
+                messagebox.showinfo(
+                    "Complete",
+                    f"Sending complete!\n\n{lines}\n\nTotal: {queue_total}\nSent: {sent_total}\nFailed: {queue_total - sent_total}"
+                )
+            
         except Exception as e:
             self.log_status(f"Unexpected error: {str(e)}", "error")
             messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
             
         finally:
+            # Keep latencies for the next estimate, also from stopped runs
+            self.stats.save()
             self.reset_ui()
             
     def start_sending(self):
         """Start sending messages"""
-        if not self.contacts:
+        if not self.campaigns:
             messagebox.showwarning("No Contacts", "Please load a CSV file first")
             return
         
+        total = sum(len(c['contacts']) for c in self.campaigns)
+        reuse_session = self.logged_in and self.session_alive()
+        if reuse_session:
+            session_note = "The open WhatsApp Web session will be reused."
+        else:
+            session_note = "This will open Chrome browser and WhatsApp Web."
+        
+        estimate = estimate_duration(
+            self.stats, total, MIN_DELAY, MAX_DELAY,
+            skip_ratio=EXPECTED_SKIP_RATIO, send_window=SEND_WINDOW,
+            include_login=not reuse_session
+        )
+        
         # Confirm
         response = messagebox.askyesno(
             "Confirm",
-            f"Send messages to {len(self.contacts)} contacts?\n\nThis will open Chrome browser and WhatsApp Web."
+            f"Send {len(self.campaigns)} campaigns to {total} contacts?\n\n"
+            f"Estimated duration: {describe_estimate(estimate)}\n\n{session_note}"
         )
         
         if not response:
@@ -468,12 +695,33 @@ class WhatsAppSenderGUI:
         self.start_btn.config(state=DISABLED)
         self.stop_btn.config(state=NORMAL)
         self.progress['value'] = 0
-        self.progress_label.config(text="0 / 0 messages sent")
+        self.progress_label.config(text="Campaign: 0 / 0 messages sent")
+        self.queue_progress['value'] = 0
+        self.queue_label.config(text=f"Queue: 0 / {total} messages sent")
         
         # Start in thread
-        thread = threading.Thread(target=self.send_messages_thread, daemon=True)
+        thread = threading.Thread(target=self.run_worker, daemon=True)
         thread.start()
         
+    def run_worker(self):
+        """Worker thread body, with optional tracing and cProfile"""
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        trace_file = f"trace_{stamp}.json" if self.trace_var.get() else None
+        profile_file = f"profile_{stamp}.prof" if self.profile_var.get() else None
+        
+        tracer.enabled = False
+        if trace_file:
+            tracer.enable()
+        try:
+            run_profiled(self.send_messages_thread, profile_file)
+        finally:
+            if trace_file:
+                tracer.save(trace_file)
+                tracer.enabled = False
+                self.log_status(f"Trace written to {trace_file}", "info")
+            if profile_file:
+                self.log_status(f"Profile written to {profile_file}", "info")
+        
     def stop_sending(self):
         """Stop sending messages"""
         self.should_stop = True
@@ -484,8 +732,17 @@ class WhatsAppSenderGUI:
         """Reset UI after sending"""
         self.is_sending = False
         self.should_stop = False
-        self.start_btn.config(state=NORMAL)
+        self.start_btn.config(state=NORMAL if self.campaigns else DISABLED)
         self.stop_btn.config(state=DISABLED)
+        
+    def on_close(self):
+        """Quit the browser session and close the window"""
+        if self.is_sending:
+            if not messagebox.askyesno("Quit", "Sending is in progress. Quit anyway?"):
+                return
+            self.should_stop = True
+        self.close_driver()
+        self.root.destroy()
 
 
 def main():
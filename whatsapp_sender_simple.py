@@ -3,11 +3,14 @@ WhatsApp Web Bulk Message Sender (Simplified Version)
 Works better on Windows - uses simpler ChromeDriver setup
 """
 
+import argparse
 import csv
 import time
 import random
 import os
+import signal
 import sys
+from urllib.parse import quote
 from typing import List, Dict
 
 try:
@@ -15,18 +18,26 @@ try:
     from selenium.webdriver.common.by import By
     from selenium.webdriver.common.keys import Keys
     from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.options import Options
     from selenium.common.exceptions import TimeoutException, NoSuchElementException
 except ImportError:
     print("ERROR: Selenium not installed. Run: pip install selenium")
     sys.exit(1)
 
+from whatsapp_composer import chat_url, find_composer, insert_text, clear_text
+from whatsapp_follow import FeedFollower
+from whatsapp_planner import LatencyStats, estimate_duration, describe_estimate, format_duration, seconds_until_window
+from whatsapp_trace import tracer, run_profiled, CAT_SETUP, CAT_PAGE, CAT_SELENIUM, CAT_PACING
+
 # Configuration
 CSV_FILE = "sample.csv"
 MIN_DELAY = 5
 MAX_DELAY = 10
 QR_SCAN_TIMEOUT = 120
+EXPECTED_SKIP_RATIO = 0.0  # share of rows expected to be skipped, used for planning
+SEND_WINDOW = None  # e.g. (9, 21) to only send between 09:00 and 21:00
+FOLLOW_POLL_INTERVAL = 5  # seconds between checks for new rows in follow mode
+FOLLOW_SEND_ATTEMPTS = 3  # tries per row before it is moved to the failed file
 
 def print_colored(message: str, color: str = "white"):
     """Print colored text"""
@@ -58,6 +69,10 @@ def read_csv(file_path: str) -> List[Dict[str, str]]:
 
 def setup_driver():
     """Set up Chrome driver - simplified version"""
+    with tracer.span("setup_driver", CAT_SETUP):
+        return _setup_driver()
+
+def _setup_driver():
     print_colored("Setting up Chrome browser...", "blue")
     
     chrome_options = Options()
@@ -71,7 +86,8 @@ def setup_driver():
     try:
         # Try method 1: Let Selenium find ChromeDriver automatically
         print_colored("  → Attempting automatic setup...", "blue")
-        driver = webdriver.Chrome(options=chrome_options)
+        with tracer.span("launch chrome", CAT_SETUP):
+            driver = webdriver.Chrome(options=chrome_options)
         print_colored("✓ Browser setup complete!", "green")
         return driver
         
@@ -84,8 +100,10 @@ def setup_driver():
             from selenium.webdriver.chrome.service import Service
             from webdriver_manager.chrome import ChromeDriverManager
             
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            with tracer.span("webdriver-manager install", CAT_SETUP):
+                service = Service(ChromeDriverManager().install())
+            with tracer.span("launch chrome", CAT_SETUP, via="webdriver-manager"):
+                driver = webdriver.Chrome(service=service, options=chrome_options)
             print_colored("✓ Browser setup complete!", "green")
             return driver
             
@@ -108,152 +126,476 @@ def setup_driver():
 def send_message(driver, wait, phone: str, message: str) -> bool:
     """Send a message"""
     try:
-        url = f"https://web.whatsapp.com/send?phone={phone}&text={message}"
-        driver.get(url)
-        time.sleep(5)
+        with tracer.span("open chat", CAT_PAGE):
+            driver.get(chat_url(phone))
+        tracer.sleep(5, "settle after load")
         
         # Wait for message input
-        selectors = [
-            '//div[@contenteditable="true"][@data-tab="10"]',
-            '//div[@contenteditable="true"][@role="textbox"]',
-        ]
+        with tracer.span("wait composer", CAT_SELENIUM):
+            composer = find_composer(wait)
         
-        for selector in selectors:
-            try:
-                wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-                break
-            except:
-                continue
+        # Paste the whole message at once instead of passing it in the URL
+        with tracer.span("insert text", CAT_SELENIUM, chars=len(message)):
+            if not insert_text(driver, composer, message):
+                raise Exception("Input box does not hold exactly the message text")
         
-        time.sleep(3)
+        tracer.sleep(3, "settle before send")
         
         # Find and click send button
-        try:
-            send_btn = driver.find_element(By.XPATH, '//button[@data-testid="send"]')
-        except:
+        with tracer.span("find send button", CAT_SELENIUM):
             try:
-                send_btn = driver.find_element(By.XPATH, '//button[.//span[@data-icon="send"]]')
+                send_btn = driver.find_element(By.XPATH, '//button[@data-testid="send"]')
             except:
-                send_btn = driver.find_element(By.XPATH, '//button[contains(@aria-label, "Send")]')
+                try:
+                    send_btn = driver.find_element(By.XPATH, '//button[.//span[@data-icon="send"]]')
+                except:
+                    send_btn = driver.find_element(By.XPATH, '//button[contains(@aria-label, "Send")]')
         
-        send_btn.click()
-        time.sleep(2)
+        with tracer.span("click send", CAT_SELENIUM):
+            send_btn.click()
+        tracer.sleep(2, "settle after send")
         return True
         
     except Exception as e:
         print_colored(f"Error: {str(e)[:100]}", "red")
         return False
 
+def load_campaigns(file_paths: List[str]) -> List[Dict]:
+    """Read every CSV in the queue into a campaign"""
+    campaigns = []
+    for file_path in file_paths:
+        print_colored(f"Reading CSV file: {file_path}", "blue")
+        contacts = read_csv(file_path)
+        if not contacts:
+            print_colored(f"  ✗ No valid contacts in {file_path}, skipping", "yellow")
+            continue
+        print_colored(f"✓ Found {len(contacts)} contacts", "green")
+        campaigns.append({
+            'name': os.path.basename(file_path),
+            'file': file_path,
+            'contacts': contacts
+        })
+    return campaigns
+
+def wait_for_login(driver) -> bool:
+    """Open WhatsApp Web and wait for the QR code to be scanned"""
+    print_colored("\nOpening WhatsApp Web...", "blue")
+    with tracer.span("open whatsapp web", CAT_PAGE):
+        driver.get("https://web.whatsapp.com")
+    
+    print_colored("\n" + "=" * 60, "yellow")
+    print_colored("   SCAN QR CODE NOW!", "yellow")
+    print_colored("   You have 3 minutes to scan", "yellow")
+    print_colored("=" * 60 + "\n", "yellow")
+    
+    login_selectors = [
+        '//div[@contenteditable="true"][@data-tab="3"]',  # Search box
+        '//div[@contenteditable="true"][@role="textbox"]',  # Any textbox
+        '//canvas[@aria-label="Scan me!"]',  # QR code canvas (means not logged in)
+    ]
+    
+    print_colored("Waiting for you to scan QR code...", "blue")
+    
+    # Keep checking every 5 seconds
+    with tracer.span("wait for qr scan", CAT_SELENIUM):
+        for attempt in range(36):  # 36 * 5 = 180 seconds
+            try:
+                # Check if logged in (search box appears)
+                driver.find_element(By.XPATH, login_selectors[0])
+                return True
+            except:
+                try:
+                    driver.find_element(By.XPATH, login_selectors[1])
+                    return True
+                except:
+                    # Still on QR code screen
+                    if attempt % 6 == 0:  # Print every 30 seconds
+                        remaining = 180 - (attempt * 5)
+                        print_colored(f"  Still waiting... ({remaining}s remaining)", "yellow")
+                    time.sleep(5)
+        return False
+
+def run_campaign(driver, wait, campaign: Dict, number: int, queue: Dict) -> int:
+    """Send one campaign on the already logged-in session, returns sent count"""
+    contacts = campaign['contacts']
+    
+    print_colored(f"\n{'=' * 60}", "blue")
+    print_colored(f"   Campaign {number}/{queue['campaigns']}: {campaign['name']}", "blue")
+    print_colored(f"   Sending {len(contacts)} messages", "blue")
+    print_colored(f"{'=' * 60}\n", "blue")
+    
+    sent = 0
+    for i, contact in enumerate(contacts, 1):
+        name = contact['name']
+        phone = contact['phone']
+        message = contact['message'].replace('{name}', name)
+        
+        # Hold until the send window opens
+        hold = seconds_until_window(SEND_WINDOW)
+        if hold:
+            print_colored(f"⏸ Outside send window, waiting {format_duration(hold)}...", "yellow")
+            tracer.sleep(hold, "send window wait", CAT_PACING)
+        
+        queue['done'] += 1
+        print(f"\n[{i}/{len(contacts)}] (queue {queue['done']}/{queue['total']}) {name} ({phone})")
+        print(f"Message: {message[:50]}...")
+        
+        started = time.perf_counter()
+        with tracer.span("send_message", phone=phone, campaign=campaign['name']):
+            ok = send_message(driver, wait, phone, message)
+        queue['stats'].record("send" if ok else "failed_send", time.perf_counter() - started)
+        
+        if ok:
+            sent += 1
+            print_colored(f"✓ Sent to {name}!", "green")
+        else:
+            print_colored(f"✗ Failed to send to {name}", "red")
+        
+        # Refine the ETA with this run's latencies
+        remaining = queue['total'] - queue['done']
+        if remaining:
+            eta = estimate_duration(
+                queue['stats'], remaining, MIN_DELAY, MAX_DELAY,
+                send_window=SEND_WINDOW, include_login=False
+            )
+            print_colored(f"ETA: {describe_estimate(eta)}", "blue")
+        
+        # Pace between every message of the queue, not just within a campaign
+        if queue['done'] < queue['total']:
+            delay = random.randint(MIN_DELAY, MAX_DELAY)
+            print_colored(f"⏳ Waiting {delay}s...", "yellow")
+            tracer.sleep(delay, "pacing wait", CAT_PACING)
+    
+    print_colored(f"\nCampaign {campaign['name']}: Total: {len(contacts)} | Sent: {sent} | Failed: {len(contacts) - sent}", "white")
+    return sent
+
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="WhatsApp Web Bulk Message Sender")
+    parser.add_argument(
+        "csv_files",
+        nargs="*",
+        default=[CSV_FILE],
+        help=f"CSV files to send, run one after another on one login (default: {CSV_FILE})"
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="record a timeline of the run as Chrome trace-event JSON"
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="dump a cProfile of the run (view with snakeviz or pstats)"
+    )
+    parser.add_argument(
+        "--bench-compose",
+        metavar="PHONE",
+        help="time message insertion into PHONE's chat for short and 4 KB texts without sending"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="show the queue and estimated duration without opening the browser"
+    )
+    parser.add_argument(
+        "--skip-ratio",
+        type=float,
+        default=EXPECTED_SKIP_RATIO,
+        help=f"share of rows expected to be skipped, for the estimate (default: {EXPECTED_SKIP_RATIO})"
+    )
+    parser.add_argument(
+        "--follow",
+        metavar="PATH",
+        help="keep sending rows appended to a CSV/JSONL file or spool directory until Ctrl+C"
+    )
+    args = parser.parse_args()
+    
+    if not 0 <= args.skip_ratio < 1:
+        parser.error("--skip-ratio must be at least 0 and below 1")
+    if args.follow and not os.path.exists(args.follow):
+        parser.error(f"--follow feed not found: {args.follow}")
+    
+    if args.trace:
+        tracer.enable()
+    try:
+        run_profiled(run, args.profile, args)
+    finally:
+        if args.trace:
+            tracer.save(args.trace)
+            print_colored(f"Trace written to {args.trace}", "blue")
+
+def start_session(stats: LatencyStats = None):
+    """Launch Chrome and log in, returns (driver, wait) or None"""
+    started = time.perf_counter()
+    driver = setup_driver()
+    driver.maximize_window()
+    wait = WebDriverWait(driver, 20)
+    
+    try:
+        with tracer.span("login"):
+            logged_in = wait_for_login(driver)
+    except Exception as e:
+        print_colored(f"✗ Error waiting for login: {str(e)}", "red")
+        driver.quit()
+        return None
+    
+    if not logged_in:
+        print_colored("✗ QR code scan timeout!", "red")
+        print_colored("Please run the script again and scan faster", "yellow")
+        driver.quit()
+        return None
+    
+    print_colored("✓ Logged in successfully!", "green")
+    time.sleep(3)
+    if stats:
+        stats.record("login", time.perf_counter() - started)
+    return driver, wait
+
+def bench_compose(driver, wait, phone: str, rounds: int = 5):
+    """Time composer text insertion for short and 4 KB messages, nothing is sent"""
+    # Characters that broke the ?text= URL: & # % newlines and emoji
+    line = "Hello Amaan & team #1 – 100% ready? ✅🎉 Details: https://example.com/?a=1&b=2\n"
+    messages = [
+        ("short", "Hi Amaan, this is a test message"),
+        ("4 KB", line * (4096 // len(line.encode('utf-8')))),
+    ]
+    
+    driver.get(chat_url(phone))
+    composer = find_composer(wait)
+    time.sleep(3)
+    
+    print_colored(f"\n{'=' * 60}", "blue")
+    print_colored(f"   Composer insert benchmark ({rounds} rounds, nothing is sent)", "blue")
+    print_colored(f"{'=' * 60}\n", "blue")
+    
+    for label, message in messages:
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            ok = insert_text(driver, composer, message)
+            timings.append((time.perf_counter() - start) * 1000)
+            clear_text(driver, composer)
+            if not ok:
+                print_colored(f"✗ {label}: input box does not hold exactly the message text", "red")
+                break
+        else:
+            timings.sort()
+            old_url = len(f"https://web.whatsapp.com/send?phone={phone}&text={quote(message)}")
+            print_colored(
+                f"{label:>6}: {len(message.encode('utf-8'))} bytes, {message.count(chr(10))} line breaks | "
+                f"median {timings[len(timings) // 2]:.1f} ms, max {timings[-1]:.1f} ms | "
+                f"encoded ?text= URL would be {old_url} chars",
+                "white"
+            )
+
+def session_alive(driver) -> bool:
+    """Whether Chrome still responds and WhatsApp Web is still logged in"""
+    try:
+        driver.current_url
+        return not driver.find_elements(By.XPATH, '//canvas[@aria-label="Scan me!"]')
+    except Exception:
+        return False
+
+def pause(seconds: float, stop: Dict, name: str = "pacing wait") -> bool:
+    """Sleep in short steps, returns False as soon as a stop is requested"""
+    deadline = time.monotonic() + seconds
+    with tracer.span(name, CAT_PACING, seconds=seconds):
+        while not stop['requested']:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            time.sleep(min(1.0, remaining))
+    return False
+
+def follow_feed(follower: FeedFollower, stats: LatencyStats):
+    """Send rows appended to the feed until Ctrl+C"""
+    print_colored(f"\n{'=' * 60}", "blue")
+    print_colored(f"   Following {follower.feed_path}", "blue")
+    print_colored("   Press Ctrl+C to stop", "blue")
+    print_colored(f"{'=' * 60}\n", "blue")
+    
+    # Ctrl+C only sets a flag checked between rows, so a sent row is always
+    # journaled and committed before we exit. A second Ctrl+C forces it.
+    stop = {'requested': False}
+    
+    def request_stop(signum, frame):
+        if stop['requested']:
+            raise KeyboardInterrupt
+        stop['requested'] = True
+        print_colored("\nStopping after the current row, press Ctrl+C again to force", "yellow")
+    
+    previous_handler = signal.signal(signal.SIGINT, request_stop)
+    session = None
+    sent = failed = 0
+    next_send = 0.0
+    try:
+        while not stop['requested']:
+            if session is None:
+                session = start_session(stats)
+                if not session:
+                    print_colored("✗ Could not log in, stopping. Unsent rows stay in the feed.", "red")
+                    return
+                driver, wait = session
+            
+            contacts = follower.poll()
+            if not contacts:
+                pause(FOLLOW_POLL_INTERVAL, stop, "idle poll wait")
+                continue
+            
+            for contact in contacts:
+                if stop['requested']:
+                    break
+                
+                if not contact['valid']:
+                    print_colored(f"✗ Skipping invalid row ending at byte {contact['offset']} of {contact['source']}", "yellow")
+                    follower.commit(contact, "skipped")
+                    continue
+                
+                name = contact['name']
+                phone = contact['phone']
+                message = contact['message'].replace('{name}', name)
+                
+                ok = False
+                outcome = None
+                for attempt in range(1, FOLLOW_SEND_ATTEMPTS + 1):
+                    # Pace against the previous send, idle time already counts
+                    hold = max(next_send - time.monotonic(), seconds_until_window(SEND_WINDOW))
+                    if hold > 0:
+                        print_colored(f"⏳ Waiting {format_duration(hold)}...", "yellow")
+                        if not pause(hold, stop):
+                            break
+                    
+                    print(f"\n[follow] {name} ({phone}) attempt {attempt}/{FOLLOW_SEND_ATTEMPTS}")
+                    started = time.perf_counter()
+                    with tracer.span("send_message", phone=phone, campaign="follow"):
+                        ok = send_message(driver, wait, phone, message)
+                    stats.record("send" if ok else "failed_send", time.perf_counter() - started)
+                    next_send = time.monotonic() + random.randint(MIN_DELAY, MAX_DELAY)
+                    
+                    if ok:
+                        outcome = "sent"
+                        break
+                    if not session_alive(driver):
+                        outcome = "session lost"
+                        break
+                    outcome = "failed"
+                    if stop['requested']:
+                        break
+                
+                if outcome == "session lost":
+                    # Not the row's fault, leave it uncommitted and log in again
+                    print_colored("✗ Browser closed or logged out, logging in again...", "red")
+                    try:
+                        driver.quit()
+                    except Exception:
+                        pass
+                    session = None
+                    break
+                if outcome is None:
+                    break  # stopped before the first attempt, row stays unsent
+                
+                if ok:
+                    sent += 1
+                    print_colored(f"✓ Sent to {name}! (sent {sent}, failed {failed})", "green")
+                else:
+                    failed += 1
+                    print_colored(f"✗ Failed to send to {name}, kept in {follower.failed_file} (sent {sent}, failed {failed})", "red")
+                
+                # A crash between the send and this commit can still resend the row on restart
+                follower.commit(contact, outcome)
+                stats.save()
+            
+            # Rows read but not committed are read again on the next poll
+            follower.rewind()
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        if session:
+            session[0].quit()
+    
+    print_colored(f"\nFollow mode stopped. Sent: {sent} | Failed: {failed}", "white")
+
+def run(args):
+    """Run the campaign queue from parsed arguments"""
     print("=" * 60)
     print("   WhatsApp Web Bulk Message Sender (Simple Version)")
     print("=" * 60)
     print()
     
     try:
-        # Read CSV
-        print_colored(f"Reading CSV file: {CSV_FILE}", "blue")
-        contacts = read_csv(CSV_FILE)
-        print_colored(f"✓ Found {len(contacts)} contacts", "green")
-        
-        print("\nContacts:")
-        for i, c in enumerate(contacts, 1):
-            print(f"  {i}. {c['name']} - {c['phone']}")
-        
-        response = input("\nProceed? (yes/no): ").strip().lower()
-        if response not in ['yes', 'y']:
-            print("Cancelled.")
+        if args.bench_compose:
+            session = start_session()
+            if session:
+                driver, wait = session
+                bench_compose(driver, wait, args.bench_compose)
+                driver.quit()
             return
         
-        # Setup browser
-        driver = setup_driver()
-        driver.maximize_window()
-        wait = WebDriverWait(driver, 20)
-        
-        # Open WhatsApp
-        print_colored("\nOpening WhatsApp Web...", "blue")
-        driver.get("https://web.whatsapp.com")
+        if args.follow:
+            stats = LatencyStats()
+            follower = FeedFollower(args.follow, log=lambda message: print_colored(message, "yellow"))
+            try:
+                follow_feed(follower, stats)
+            finally:
+                stats.save()
+            return
         
-        print_colored("\n" + "=" * 60, "yellow")
-        print_colored("   SCAN QR CODE NOW!", "yellow")
-        print_colored("   You have 3 minutes to scan", "yellow")
-        print_colored("=" * 60 + "\n", "yellow")
+        # Read all CSVs up front so a bad file fails before the browser opens
+        campaigns = load_campaigns(args.csv_files)
+        if not campaigns:
+            print_colored("✗ No contacts to send", "red")
+            return
         
-        # Wait for login - try multiple selectors with longer timeout
-        login_wait = WebDriverWait(driver, 180)  # 3 minutes
-        logged_in = False
+        total = sum(len(c['contacts']) for c in campaigns)
         
-        login_selectors = [
-            '//div[@contenteditable="true"][@data-tab="3"]',  # Search box
-            '//div[@contenteditable="true"][@role="textbox"]',  # Any textbox
-            '//canvas[@aria-label="Scan me!"]',  # QR code canvas (means not logged in)
-        ]
+        print("\nCampaign queue:")
+        for n, campaign in enumerate(campaigns, 1):
+            print(f"  {n}. {campaign['name']} ({len(campaign['contacts'])} contacts)")
+            for i, c in enumerate(campaign['contacts'], 1):
+                print(f"     {i}. {c['name']} - {c['phone']}")
+        print(f"\nTotal: {len(campaigns)} campaigns, {total} contacts")
         
-        print_colored("Waiting for you to scan QR code...", "blue")
+        stats = LatencyStats()
+        estimate = estimate_duration(
+            stats, total, MIN_DELAY, MAX_DELAY,
+            skip_ratio=args.skip_ratio, send_window=SEND_WINDOW
+        )
+        print(f"Estimated duration: {describe_estimate(estimate)}")
         
-        try:
-            # Keep checking every 5 seconds
-            for attempt in range(36):  # 36 * 5 = 180 seconds
-                try:
-                    # Check if logged in (search box appears)
-                    driver.find_element(By.XPATH, login_selectors[0])
-                    logged_in = True
-                    break
-                except:
-                    try:
-                        driver.find_element(By.XPATH, login_selectors[1])
-                        logged_in = True
-                        break
-                    except:
-                        # Still on QR code screen
-                        if attempt % 6 == 0:  # Print every 30 seconds
-                            remaining = 180 - (attempt * 5)
-                            print_colored(f"  Still waiting... ({remaining}s remaining)", "yellow")
-                        time.sleep(5)
-            
-            if not logged_in:
-                print_colored("✗ QR code scan timeout!", "red")
-                print_colored("Please run the script again and scan faster", "yellow")
-                driver.quit()
-                return
-                
-        except Exception as e:
-            print_colored(f"✗ Error waiting for login: {str(e)}", "red")
-            driver.quit()
+        if args.dry_run:
+            print("\nDry run, nothing sent.")
             return
         
-        print_colored("✓ Logged in successfully!", "green")
-        time.sleep(3)
+        response = input("\nProceed? (yes/no): ").strip().lower()
+        if response not in ['yes', 'y']:
+            print("Cancelled.")
+            return
         
-        # Send messages
-        print_colored(f"\n{'=' * 60}", "blue")
-        print_colored(f"   Sending {len(contacts)} messages", "blue")
-        print_colored(f"{'=' * 60}\n", "blue")
+        # Setup browser once for the whole queue
+        session = start_session(stats)
+        if not session:
+            return
+        driver, wait = session
         
-        sent = 0
-        for i, contact in enumerate(contacts, 1):
-            name = contact['name']
-            phone = contact['phone']
-            message = contact['message'].replace('{name}', name)
-            
-            print(f"\n[{i}/{len(contacts)}] {name} ({phone})")
-            print(f"Message: {message[:50]}...")
-            
-            if send_message(driver, wait, phone, message):
-                sent += 1
-                print_colored(f"✓ Sent to {name}!", "green")
-            else:
-                print_colored(f"✗ Failed to send to {name}", "red")
-            
-            if i < len(contacts):
-                delay = random.randint(MIN_DELAY, MAX_DELAY)
-                print_colored(f"⏳ Waiting {delay}s...", "yellow")
-                time.sleep(delay)
+        # Send every campaign on the same session
+        queue = {'campaigns': len(campaigns), 'done': 0, 'total': total, 'stats': stats}
+        results = []
+        try:
+            for n, campaign in enumerate(campaigns, 1):
+                with tracer.span(f"campaign {campaign['name']}"):
+                    sent = run_campaign(driver, wait, campaign, n, queue)
+                results.append((campaign, sent))
+        finally:
+            # Keep latencies from interrupted runs for the next estimate
+            stats.save()
         
         # Summary
+        sent_total = sum(sent for _, sent in results)
         print_colored(f"\n{'=' * 60}", "blue")
-        print_colored(f"Total: {len(contacts)} | Sent: {sent} | Failed: {len(contacts) - sent}", "white")
+        for campaign, sent in results:
+            count = len(campaign['contacts'])
+            print_colored(f"{campaign['name']}: Sent: {sent} | Failed: {count - sent}", "white")
+        print_colored(f"Total: {total} | Sent: {sent_total} | Failed: {total - sent_total}", "white")
         print_colored(f"{'=' * 60}\n", "blue")
         
         input("Press Enter to close...")
@@ -0,0 +1,108 @@
+"""
+Timeline tracing and profiling for campaign runs
+Writes Chrome trace-event JSON (open in chrome://tracing or ui.perfetto.dev)
+"""
+
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable
+
+# Span categories, so the viewer can tell where the time went
+CAT_SETUP = "setup"        # Chrome launch and driver setup
+CAT_PAGE = "page"          # driver.get page loads
+CAT_SELENIUM = "selenium"  # element lookups, waits and clicks
+CAT_SLEEP = "sleep"        # fixed settle sleeps
+CAT_PACING = "pacing"      # random delay between messages
+CAT_RUN = "run"            # campaign, login and per-message parents
+
+_NO_SPAN = nullcontext()
+
+
+class Tracer:
+    """Collects complete ("X") trace events while enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.threads = {}
+        self.pid = os.getpid()
+        self._start = time.perf_counter()
+
+    def enable(self):
+        """Start recording spans from now on"""
+        self.enabled = True
+        self.events = []
+        self.threads = {}
+        self._start = time.perf_counter()
+
+    def span(self, name: str, cat: str = CAT_RUN, **args):
+        """Context manager timing one phase, a shared no-op when disabled"""
+        if not self.enabled:
+            return _NO_SPAN
+        return self._span(name, cat, args)
+
+    @contextmanager
+    def _span(self, name, cat, args):
+        thread = threading.current_thread()
+        self.threads[thread.ident] = thread.name
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            event = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (begin - self._start) * 1e6,
+                "dur": (end - begin) * 1e6,
+                "pid": self.pid,
+                "tid": thread.ident,
+            }
+            if args:
+                event["args"] = args
+            # list.append is atomic, so worker threads can record concurrently
+            self.events.append(event)
+
+    def sleep(self, seconds: float, name: str = "sleep", cat: str = CAT_SLEEP):
+        """time.sleep recorded as its own span"""
+        with self.span(name, cat, seconds=seconds):
+            time.sleep(seconds)
+
+    def save(self, file_path: str):
+        """Write the recorded spans as Chrome trace-event JSON"""
+        thread_names = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self.pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in self.threads.items()
+        ]
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(
+                {"traceEvents": thread_names + self.events, "displayTimeUnit": "ms"},
+                file
+            )
+
+
+def run_profiled(func: Callable, profile_path: str = None, *args, **kwargs):
+    """Run func, dumping a cProfile of it to profile_path when one is given"""
+    if not profile_path:
+        return func(*args, **kwargs)
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        profiler.dump_stats(profile_path)
+
+
+# Shared tracer, disabled until a script turns tracing on
+tracer = Tracer()